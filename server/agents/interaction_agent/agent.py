@@ -1,8 +1,9 @@
 """Interaction agent helpers for prompt construction."""
 
+from functools import lru_cache
 from html import escape
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from ...services.execution import get_agent_roster
 
@@ -45,17 +46,18 @@ def _render_conversation_history(transcript: str) -> str:
 def _render_active_agents() -> str:
     roster = get_agent_roster()
     roster.load()
-    agents = roster.get_agents()
+    return _render_agent_tags(tuple(roster.get_agents()))
 
+
+# Memoize the rendered roster since it rarely changes between turns
+@lru_cache(maxsize=1)
+def _render_agent_tags(agents: Tuple[str, ...]) -> str:
     if not agents:
         return "None"
 
-    rendered: List[str] = []
-    for agent_name in agents:
-        name = escape(agent_name or "agent", quote=True)
-        rendered.append(f'<agent name="{name}" />')
-
-    return "\n".join(rendered)
+    return "\n".join(
+        f'<agent name="{escape(agent_name or "agent", quote=True)}" />' for agent_name in agents
+    )
 
 
 # Wrap the current message in appropriate XML tags based on sender type
@@ -1,6 +1,7 @@
 """Interaction Agent Runtime - handles LLM calls for user and agent turns."""
 
 import json
+import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 
@@ -206,10 +207,11 @@ class InteractionAgentRuntime:
     ) -> Dict[str, Any]:
         """Make an LLM call via OpenRouter."""
 
-        logger.debug(
-            "Interaction agent calling LLM",
-            extra={"model": self.model, "tools": len(self.tool_schemas)},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Interaction agent calling LLM",
+                extra={"model": self.model, "tools": len(self.tool_schemas)},
+            )
         return await request_chat_completion(
             model=self.model,
             messages=messages,
@@ -313,18 +315,19 @@ class InteractionAgentRuntime:
                 extra={"tool": tool_call.name},
             )
             wrapped = ToolResult(success=True, payload=result)
-            self._log_tool_invocation(tool_call, stage="done", result=wrapped)
+            self._log_tool_invocation(tool_call, stage="done")
             return wrapped
 
-        status = "success" if result.success else "error"
-        logger.debug(
-            "Tool executed",
-            extra={
-                "tool": tool_call.name,
-                "status": status,
-            },
-        )
-        self._log_tool_invocation(tool_call, stage="done", result=result)
+        if logger.isEnabledFor(logging.DEBUG):
+            status = "success" if result.success else "error"
+            logger.debug(
+                "Tool executed",
+                extra={
+                    "tool": tool_call.name,
+                    "status": status,
+                },
+            )
+        self._log_tool_invocation(tool_call, stage="done")
         return result
 
     # Format tool execution results into JSON for LLM consumption
@@ -362,37 +365,16 @@ class InteractionAgentRuntime:
         tool_call: _ToolCall,
         *,
         stage: str,
-        result: Optional[ToolResult] = None,
         detail: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Emit structured logs for tool lifecycle events."""
-
-        cleaned_args = {
-            key: value
-            for key, value in tool_call.arguments.items()
-            if key != "__invalid_arguments__"
-        }
-
-        log_payload: Dict[str, Any] = {
-            "tool": tool_call.name,
-            "stage": stage,
-            "arguments": cleaned_args,
-        }
-
-        if result is not None:
-            log_payload["success"] = result.success
-            if result.payload is not None:
-                log_payload["payload"] = result.payload
-
-        if detail:
-            log_payload.update(detail)
+        """Emit logs for tool lifecycle events."""
 
         if stage == "done":
-            logger.info(f"Tool '{tool_call.name}' completed")
+            logger.info("Tool '%s' completed", tool_call.name)
         elif stage in {"error", "rejected"}:
-            logger.warning(f"Tool '{tool_call.name}' {stage}")
+            logger.warning("Tool '%s' %s", tool_call.name, stage, extra=detail)
         else:
-            logger.debug(f"Tool '{tool_call.name}' {stage}")
+            logger.debug("Tool '%s' %s", tool_call.name, stage)
 
     # Determine final user-facing response from interaction loop summary
     def _finalize_response(self, summary: _LoopSummary) -> str:
@@ -3,7 +3,7 @@
 import asyncio
 import json
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
 
 from ...logging_config import logger
 from ...services.conversation import get_conversation_log
@@ -214,6 +214,15 @@ def get_tool_schemas():
     return TOOL_SCHEMAS
 
 
+# Map tool names to their handlers for single-lookup dispatch
+_TOOL_HANDLERS: Dict[str, Callable[..., ToolResult]] = {
+    "send_message_to_agent": send_message_to_agent,
+    "send_message_to_user": send_message_to_user,
+    "send_draft": send_draft,
+    "wait": wait,
+}
+
+
 # Route tool calls to appropriate handlers with argument validation and error handling
 def handle_tool_call(name: str, arguments: Any) -> ToolResult:
     """Handle tool calls from interaction agent."""
@@ -225,17 +234,12 @@ def handle_tool_call(name: str, arguments: Any) -> ToolResult:
         else:
             return ToolResult(success=False, payload={"error": "Invalid arguments format"})
 
-        if name == "send_message_to_agent":
-            return send_message_to_agent(**args)
-        if name == "send_message_to_user":
-            return send_message_to_user(**args)
-        if name == "send_draft":
-            return send_draft(**args)
-        if name == "wait":
-            return wait(**args)
-
-        logger.warning("unexpected tool", extra={"tool": name})
-        return ToolResult(success=False, payload={"error": f"Unknown tool: {name}"})
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
+            logger.warning("unexpected tool", extra={"tool": name})
+            return ToolResult(success=False, payload={"error": f"Unknown tool: {name}"})
+
+        return handler(**args)
     except json.JSONDecodeError:
         return ToolResult(success=False, payload={"error": "Invalid JSON"})
     except TypeError as exc:
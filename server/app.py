@@ -9,6 +9,7 @@ from fastapi.responses import JSONResponse
 
 from .config import get_settings
 from .logging_config import configure_logging, logger
+from .openrouter_client import close_client
 from .routes import api_router
 from .services import get_important_email_watcher, get_trigger_scheduler
 
@@ -77,10 +78,13 @@ async def _start_trigger_scheduler() -> None:
 @app.on_event("shutdown")
 # Gracefully shutdown background services when the app stops
 async def _stop_trigger_scheduler() -> None:
-    scheduler = get_trigger_scheduler()
-    await scheduler.stop()
-    watcher = get_important_email_watcher()
-    await watcher.stop()
+    try:
+        scheduler = get_trigger_scheduler()
+        await scheduler.stop()
+        watcher = get_important_email_watcher()
+        await watcher.stop()
+    finally:
+        await close_client()
 
 
 __all__ = ["app"]
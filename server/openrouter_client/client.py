@@ -9,6 +9,8 @@ from ..config import get_settings
 
 OpenRouterBaseURL = "https://openrouter.ai/api/v1"
 
+_client: Optional[httpx.AsyncClient] = None
+
 
 class OpenRouterError(RuntimeError):
     """Raised when the OpenRouter API returns an error response."""
@@ -29,6 +31,26 @@ def _headers(*, api_key: Optional[str] = None) -> Dict[str, str]:
     return headers
 
 
+# Reuse one pooled client so keep-alive connections survive across completions
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, releasing pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 def _build_messages(messages: List[Dict[str, str]], system: Optional[str]) -> List[Dict[str, str]]:
     if system:
         return [{"role": "system", "content": system}, *messages]
@@ -67,25 +89,23 @@ async def request_chat_completion(
 
     url = f"{base_url.rstrip('/')}/chat/completions"
 
-    async with httpx.AsyncClient() as client:
+    try:
+        response = await _get_client().post(
+            url,
+            headers=_headers(api_key=api_key),
+            json=payload,
+        )
         try:
-            response = await client.post(
-                url,
-                headers=_headers(api_key=api_key),
-                json=payload,
-                timeout=60.0,  # Set reasonable timeout instead of None
-            )
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                _handle_response_error(exc)
-            return response.json()
-        except httpx.HTTPStatusError as exc:  # pragma: no cover - handled above
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
             _handle_response_error(exc)
-        except httpx.HTTPError as exc:
-            raise OpenRouterError(f"OpenRouter request failed: {exc}") from exc
+        return response.json()
+    except httpx.HTTPStatusError as exc:  # pragma: no cover - handled above
+        _handle_response_error(exc)
+    except httpx.HTTPError as exc:
+        raise OpenRouterError(f"OpenRouter request failed: {exc}") from exc
 
     raise OpenRouterError("OpenRouter request failed: unknown error")
 
 
-__all__ = ["OpenRouterError", "request_chat_completion", "OpenRouterBaseURL"]
+__all__ = ["OpenRouterError", "close_client", "request_chat_completion", "OpenRouterBaseURL"]
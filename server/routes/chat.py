@@ -1,8 +1,16 @@
+import asyncio
+
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
 from ..models import ChatHistoryClearResponse, ChatHistoryResponse, ChatRequest
-from ..services import get_conversation_log, get_trigger_service, handle_chat_request
+from ..services import (
+    get_agent_roster,
+    get_conversation_log,
+    get_execution_agent_logs,
+    get_trigger_service,
+    handle_chat_request,
+)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
@@ -23,24 +31,15 @@ def chat_history() -> ChatHistoryResponse:
 
 
 @router.delete("/history", response_model=ChatHistoryClearResponse)
-def clear_history() -> ChatHistoryClearResponse:
-    from ..services import get_execution_agent_logs, get_agent_roster
-
-    # Clear conversation log
-    log = get_conversation_log()
-    log.clear()
-
-    # Clear execution agent logs
-    execution_logs = get_execution_agent_logs()
-    execution_logs.clear_all()
-
-    # Clear agent roster
-    roster = get_agent_roster()
-    roster.clear()
-
-    # Clear stored triggers
-    trigger_service = get_trigger_service()
-    trigger_service.clear_all()
+async def clear_history() -> ChatHistoryClearResponse:
+    # Clear the conversation log, execution agent logs, agent roster and stored
+    # triggers concurrently; each store guards its own files, so they are independent
+    await asyncio.gather(
+        asyncio.to_thread(get_conversation_log().clear),
+        asyncio.to_thread(get_execution_agent_logs().clear_all),
+        asyncio.to_thread(get_agent_roster().clear),
+        asyncio.to_thread(get_trigger_service().clear_all),
+    )
 
     return ChatHistoryClearResponse()
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request, status
 
 from ..config import Settings, get_settings
 from ..models import (
@@ -13,6 +15,21 @@ from ..services import get_timezone_store
 
 router = APIRouter(tags=["meta"])
 
+# Routes are fixed once the app is serving, so each app builds its endpoint listing once
+def _get_public_endpoints(app: FastAPI) -> List[str]:
+    endpoints: Optional[List[str]] = getattr(app.state, "public_endpoints", None)
+    if endpoints is None:
+        endpoints = sorted(
+            {
+                route.path
+                for route in app.routes
+                if getattr(route, "include_in_schema", False) and route.path.startswith("/api/")
+            }
+        )
+        app.state.public_endpoints = endpoints
+    return endpoints
+
+
 @router.get("/health", response_model=HealthResponse)
 # Return service health status for monitoring and load balancers
 def health(settings: Settings = Depends(get_settings)) -> HealthResponse:
@@ -22,18 +39,11 @@ def health(settings: Settings = Depends(get_settings)) -> HealthResponse:
 @router.get("/meta", response_model=RootResponse)
 # Return service metadata including available API endpoints
 def meta(request: Request, settings: Settings = Depends(get_settings)) -> RootResponse:
-    endpoints = sorted(
-        {
-            route.path
-            for route in request.app.routes
-            if getattr(route, "include_in_schema", False) and route.path.startswith("/api/")
-        }
-    )
     return RootResponse(
         status="ok",
         service="openpoke",
         version=settings.app_version,
-        endpoints=endpoints,
+        endpoints=_get_public_endpoints(request.app),
     )
 
 
@@ -44,7 +54,7 @@ def set_timezone(payload: SetTimezoneRequest) -> SetTimezoneResponse:
     try:
         store.set_timezone(payload.timezone)
     except ValueError as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return SetTimezoneResponse(timezone=store.get_timezone())
 
 
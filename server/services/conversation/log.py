@@ -46,9 +46,22 @@ def _resolve_working_memory_log() -> "WorkingMemoryLog":
     return get_working_memory_log()
 
 
+_TIMESTAMP_PREFIX = 'timestamp="'
 _ATTR_PATTERN = re.compile(r"(\w+)\s*=\s*\"([^\"]*)\"")
 
 
+# Both formatters write a lone timestamp attribute, so slice that out directly and only
+# fall back to the full attribute scan for other shapes a custom formatter may produce
+def _extract_timestamp(attr_string: str) -> str:
+    prefix_len = len(_TIMESTAMP_PREFIX)
+    if attr_string.startswith(_TIMESTAMP_PREFIX) and attr_string.find('"', prefix_len) == len(attr_string) - 1:
+        return attr_string[prefix_len:-1]
+    attributes: Dict[str, str] = {
+        match.group(1): match.group(2) for match in _ATTR_PATTERN.finditer(attr_string)
+    }
+    return attributes.get("timestamp", "")
+
+
 class ConversationLog:
     """Append-only conversation log persisted to disk for the interaction agent."""
 
@@ -56,6 +69,7 @@ class ConversationLog:
         self._path = path
         self._formatter = formatter
         self._lock = threading.Lock()
+        self._chat_messages_cache: Optional[Tuple[int, int, List[ChatMessage]]] = None
         self._ensure_directory()
         self._working_memory_log = _resolve_working_memory_log()
 
@@ -69,6 +83,7 @@ class ConversationLog:
         timestamp = now_in_user_timezone("%Y-%m-%d %H:%M:%S")
         entry = self._formatter(tag, timestamp, str(payload))
         with self._lock:
+            self._chat_messages_cache = None
             try:
                 with self._path.open("a", encoding="utf-8") as handle:
                     handle.write(entry)
@@ -101,16 +116,14 @@ class ConversationLog:
         if closing_tag != tag:
             return None
         payload = stripped[open_end + 1 : close_start]
-        attributes: Dict[str, str] = {
-            match.group(1): match.group(2) for match in _ATTR_PATTERN.finditer(attr_string)
-        }
-        timestamp = attributes.get("timestamp", "")
-        return tag, timestamp, _decode_payload(payload)
+        return tag, _extract_timestamp(attr_string), _decode_payload(payload)
 
     def iter_entries(self) -> Iterator[Tuple[str, str, str]]:
+        # Split on "\n" only: payloads are escaped for newlines but may still contain
+        # U+2028 and similar separators that splitlines() would break entries on
         with self._lock:
             try:
-                lines = self._path.read_text(encoding="utf-8").splitlines()
+                lines = self._path.read_text(encoding="utf-8").split("\n")
             except FileNotFoundError:
                 lines = []
             except Exception as exc:  # pragma: no cover - defensive
@@ -124,31 +137,29 @@ class ConversationLog:
                 yield item
 
     def load_transcript(self) -> str:
-        parts: List[str] = []
-        for tag, timestamp, payload in self.iter_entries():
-            safe_payload = escape(payload, quote=False)
-            if timestamp:
-                parts.append(f"<{tag} timestamp=\"{timestamp}\">{safe_payload}</{tag}>")
-            else:
-                parts.append(f"<{tag}>{safe_payload}</{tag}>")
-        return "\n".join(parts)
+        return "\n".join(
+            f"<{tag} timestamp=\"{timestamp}\">{escape(payload, quote=False)}</{tag}>"
+            if timestamp
+            else f"<{tag}>{escape(payload, quote=False)}</{tag}>"
+            for tag, timestamp, payload in self.iter_entries()
+        )
+
+    def _record(self, tag: str, content: str) -> None:
+        timestamp = self._append(tag, content)
+        self._working_memory_log.append_entry(tag, content, timestamp)
 
     def record_user_message(self, content: str) -> None:
-        timestamp = self._append("user_message", content)
-        self._working_memory_log.append_entry("user_message", content, timestamp)
+        self._record("user_message", content)
 
     def record_agent_message(self, content: str) -> None:
-        timestamp = self._append("agent_message", content)
-        self._working_memory_log.append_entry("agent_message", content, timestamp)
+        self._record("agent_message", content)
 
     def record_reply(self, content: str) -> None:
-        timestamp = self._append("poke_reply", content)
-        self._working_memory_log.append_entry("poke_reply", content, timestamp)
+        self._record("poke_reply", content)
 
     def record_wait(self, reason: str) -> None:
         """Record a wait marker that should not reach the user-facing chat history."""
-        timestamp = self._append("wait", reason)
-        self._working_memory_log.append_entry("wait", reason, timestamp)
+        self._record("wait", reason)
 
     def _notify_summarization(self) -> None:
         settings = get_settings()
@@ -173,16 +184,35 @@ class ConversationLog:
             )
 
     def to_chat_messages(self) -> List[ChatMessage]:
+        # The history endpoint is polled, so reuse the parsed messages until the file changes
+        try:
+            stat = self._path.stat()
+        except FileNotFoundError:
+            self._chat_messages_cache = None
+            return []
+        cached = self._chat_messages_cache
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return list(cached[2])
+
+        messages = self._parse_chat_messages()
+        self._chat_messages_cache = (stat.st_mtime_ns, stat.st_size, messages)
+        return list(messages)
+
+    def _parse_chat_messages(self) -> List[ChatMessage]:
+        # Entries come from our own log and are already well-formed strings,
+        # so the models are constructed without re-running validation
         messages: List[ChatMessage] = []
         for tag, timestamp, payload in self.iter_entries():
             normalized_timestamp = timestamp or None
             if tag == "user_message":
                 messages.append(
-                    ChatMessage(role="user", content=payload, timestamp=normalized_timestamp)
+                    ChatMessage.model_construct(
+                        role="user", content=payload, timestamp=normalized_timestamp
+                    )
                 )
             elif tag == "poke_reply":
                 messages.append(
-                    ChatMessage(
+                    ChatMessage.model_construct(
                         role="assistant", content=payload, timestamp=normalized_timestamp
                     )
                 )
@@ -193,6 +223,7 @@ class ConversationLog:
 
     def clear(self) -> None:
         with self._lock:
+            self._chat_messages_cache = None
             try:
                 if self._path.exists():
                     self._path.unlink()
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import json
-import re
 import threading
 from datetime import datetime
+from functools import lru_cache
 from html import escape, unescape
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from ....logging_config import logger
 from ....utils.timezones import now_in_user_timezone
+from ..log import _extract_timestamp
 from .state import LogEntry, SummaryState
 
 
@@ -232,25 +233,13 @@ class WorkingMemoryLog:
         if closing_tag != tag:
             return None
         payload = stripped[open_end + 1 : close_start]
-        timestamp = None
-        if attr_string:
-            match = re.search(r'timestamp="([^"]*)"', attr_string)
-            if match:
-                timestamp = match.group(1)
+        timestamp = _extract_timestamp(attr_string) or None
         return tag, timestamp, _decode_payload(payload)
 
 
-_working_memory_log: Optional[WorkingMemoryLog] = None
-_factory_lock = threading.Lock()
-
-
+@lru_cache(maxsize=1)
 def get_working_memory_log() -> WorkingMemoryLog:
-    global _working_memory_log
-    if _working_memory_log is None:
-        with _factory_lock:
-            if _working_memory_log is None:
-                _working_memory_log = WorkingMemoryLog(_WORKING_MEMORY_LOG_PATH)
-    return _working_memory_log
+    return WorkingMemoryLog(_WORKING_MEMORY_LOG_PATH)
 
 
 __all__ = ["WorkingMemoryLog", "get_working_memory_log"]
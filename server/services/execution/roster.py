@@ -4,6 +4,7 @@ import json
 import fcntl
 import time
 from pathlib import Path
+from typing import Optional
 
 from ...logging_config import logger
 
@@ -14,22 +15,32 @@ class AgentRoster:
     def __init__(self, roster_path: Path):
         self._roster_path = roster_path
         self._agents: list[str] = []
+        self._loaded_mtime_ns: Optional[int] = None
         self.load()
 
     def load(self) -> None:
-        """Load agent names from roster.json."""
-        if self._roster_path.exists():
-            try:
-                with open(self._roster_path, 'r') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        self._agents = [str(name) for name in data]
-            except Exception as exc:
-                logger.warning(f"Failed to load roster.json: {exc}")
-                self._agents = []
-        else:
+        """Load agent names from roster.json, skipping the read if the file is unchanged."""
+        try:
+            mtime_ns = self._roster_path.stat().st_mtime_ns
+        except OSError:
+            self._loaded_mtime_ns = None
             self._agents = []
             self.save()
+            return
+
+        if mtime_ns == self._loaded_mtime_ns:
+            return
+
+        try:
+            with open(self._roster_path, 'r') as f:
+                data = json.load(f)
+                if isinstance(data, list):
+                    self._agents = [str(name) for name in data]
+            self._loaded_mtime_ns = mtime_ns
+        except Exception as exc:
+            logger.warning(f"Failed to load roster.json: {exc}")
+            self._loaded_mtime_ns = None
+            self._agents = []
 
     def save(self) -> None:
         """Save agent names to roster.json with file locking."""
@@ -73,6 +84,7 @@ class AgentRoster:
     def clear(self) -> None:
         """Clear the agent roster."""
         self._agents = []
+        self._loaded_mtime_ns = None
         try:
             if self._roster_path.exists():
                 self._roster_path.unlink()
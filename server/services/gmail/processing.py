@@ -14,6 +14,33 @@ from ...logging_config import logger
 from ...utils.timezones import convert_to_user_timezone
 
 
+_NOISE_PATTERNS = (
+    r"View this email in your browser.*?\n",
+    r"If you can't see this email.*?\n",
+    r"This is a system-generated email.*?\n",
+    r"Please do not reply to this email.*?\n",
+    r"Unsubscribe.*?preferences.*?\n",
+    r"© \d{4}.*?All rights reserved.*?\n",
+    r"\[Image:.*?\]",
+    r"\[Image\]",
+    r"<image>.*?</image>",
+    r"\(image\)",
+    r"\(Image\)",
+    r"Image: .*?\n",
+    r"Alt text: .*?\n",
+)
+
+# Compiled once at import; kept as separate patterns because a single alternation
+# loses the regex engine's literal-prefix search and scans noticeably slower
+_NOISE_REGEXES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _NOISE_PATTERNS)
+_BLANK_LINES_PATTERN = re.compile(r"\n\s*\n\s*\n")
+_INLINE_SPACE_PATTERN = re.compile(r"[ \t]+")
+_LEADING_SPACE_PATTERN = re.compile(r"\n ")
+_EXCESS_NEWLINES_PATTERN = re.compile(r"\n{3,}")
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
 class EmailTextCleaner:
     """Clean and extract readable text from Gmail API email responses."""
 
@@ -156,36 +183,20 @@ class EmailTextCleaner:
 
     def post_process_text(self, text: str) -> str:
         text = html.unescape(text)
-        text = re.sub(r"\n\s*\n\s*\n", "\n\n", text)
-        text = re.sub(r"[ \t]+", " ", text)
-        text = re.sub(r"\n ", "\n", text)
-
-        noise_patterns = [
-            r"View this email in your browser.*?\n",
-            r"If you can't see this email.*?\n",
-            r"This is a system-generated email.*?\n",
-            r"Please do not reply to this email.*?\n",
-            r"Unsubscribe.*?preferences.*?\n",
-            r"© \d{4}.*?All rights reserved.*?\n",
-            r"\[Image:.*?\]",
-            r"\[Image\]",
-            r"<image>.*?</image>",
-            r"\(image\)",
-            r"\(Image\)",
-            r"Image: .*?\n",
-            r"Alt text: .*?\n",
-        ]
+        text = _BLANK_LINES_PATTERN.sub("\n\n", text)
+        text = _INLINE_SPACE_PATTERN.sub(" ", text)
+        text = _LEADING_SPACE_PATTERN.sub("\n", text)
 
-        for pattern in noise_patterns:
-            text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+        for pattern in _NOISE_REGEXES:
+            text = pattern.sub("", text)
 
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _EXCESS_NEWLINES_PATTERN.sub("\n\n", text)
         text = text.strip()
         return text
 
     def fallback_text_extraction(self, html_content: str) -> str:
-        stripped = re.sub(r"<[^>]+>", " ", html_content)
-        stripped = re.sub(r"\s+", " ", stripped)
+        stripped = _HTML_TAG_PATTERN.sub(" ", html_content)
+        stripped = _WHITESPACE_PATTERN.sub(" ", stripped)
         return self.post_process_text(stripped)
 
     def _extract_html_body(self, message: Dict[str, Any]) -> Optional[str]: